@@ -12,6 +12,7 @@ __all__ = [
     "subword_tokenize",
     "syllable_tokenize",
     "word_tokenize",
+    "word_tokenize_batch",
 ]
 
 from pythainlp.corpus import thai_syllables, thai_words
@@ -33,6 +34,7 @@ from pythainlp.tokenize.core import (
     subword_tokenize,
     syllable_tokenize,
     word_tokenize,
+    word_tokenize_batch,
 )
 
 from pythainlp.corpus import get_corpus as _get_corpus
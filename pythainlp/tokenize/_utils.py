@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers shared by the tokenizer functions and the tokenizer engines.
+"""
+from typing import Iterable, List
+
+
+def to_token_list(
+    segments: Iterable[str], keep_whitespace: bool
+) -> List[str]:
+    """
+    Collect tokens into a list.
+
+    If keep_whitespace is False, spaces around each token are stripped
+    and tokens that become empty are dropped.
+    A list is returned as is if nothing needs to be changed,
+    other iterables are consumed only once.
+
+    :param Iterable[str] segments: tokens
+    :param bool keep_whitespace: True to keep whitespaces
+    :return: list of tokens
+    """
+    if isinstance(segments, list):
+        if keep_whitespace or not any(
+            not seg or seg[0] == " " or seg[-1] == " " for seg in segments
+        ):
+            return segments
+    elif keep_whitespace:
+        return list(segments)
+
+    return [token for token in (seg.strip(" ") for seg in segments) if token]
@@ -3,7 +3,10 @@
 Tokenizer generic functions
 """
 import re
-from typing import Iterable, List, Union
+import sys
+from functools import lru_cache, partial
+from importlib import import_module
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 from pythainlp.tokenize import (
     DEFAULT_SENT_TOKENIZE_ENGINE,
@@ -13,8 +16,170 @@ from pythainlp.tokenize import (
     DEFAULT_WORD_DICT_TRIE,
     DEFAULT_WORD_TOKENIZE_ENGINE,
 )
+from pythainlp.tokenize._utils import to_token_list
 from pythainlp.util.trie import Trie, dict_trie
 
+# match runs of spaces, for whitespace sentence tokenizer
+_PAT_SPACES = re.compile(r" +")
+
+# sentence tokenizer engine names
+_SENT_ENGINES = ("crfcut", "whitespace", "whitespace+newline")
+
+# how an engine takes custom_dict: as a trie, as a trie along with
+# keep_whitespace, as a list of words, or not at all
+_DICT_TRIE = "trie"
+_DICT_TRIE_WHITESPACE = "trie+whitespace"
+_DICT_LIST = "list"
+_DICT_NONE = None
+
+# word tokenizer engine name ->
+# (module providing segment function, how custom_dict is passed,
+#  extra keyword arguments for segment function)
+_WORD_ENGINES = {
+    "newmm": (".newmm", _DICT_TRIE_WHITESPACE, None),
+    "onecut": (".newmm", _DICT_TRIE_WHITESPACE, None),
+    "newmm-safe": (".newmm", _DICT_TRIE_WHITESPACE, {"safe_mode": True}),
+    "attacut": (".attacut", _DICT_NONE, None),
+    "longest": (".longest", _DICT_TRIE, None),
+    "mm": (".multi_cut", _DICT_TRIE_WHITESPACE, None),
+    "multi_cut": (".multi_cut", _DICT_TRIE_WHITESPACE, None),
+    "deepcut": (".deepcut", _DICT_LIST, None),
+    "icu": (".pyicu", _DICT_NONE, None),
+}
+
+# engine name -> (segment function, how custom_dict is passed),
+# filled on first use
+_ENGINES = {}
+
+# word_tokenize results are cached only for texts up to this length,
+# short phrases recur often while long texts rarely do
+_CACHE_MAX_TEXT_LEN = 50
+_CACHE_SIZE = 65536
+
+# cached word tokens shorter than this are interned, so repeated words
+# share one string object across cache entries
+_INTERN_MAX_TOKEN_LEN = 12
+
+
+def _get_engine(
+    engine: str,
+) -> Tuple[Callable[..., List[str]], Optional[str]]:
+    """
+    Get the segment function of a word tokenizer engine.
+
+    The engine module is imported only once, on first use,
+    and its segment function is kept in :data:`_ENGINES`.
+
+    :param str engine: name of the word tokenizer engine
+    :return: segment function of the engine, and how it takes custom_dict
+    """
+    entry = _ENGINES.get(engine)
+    if entry is None:
+        if engine not in _WORD_ENGINES:
+            raise ValueError(
+                f"""Tokenizer \"{engine}\" not found.
+            It might be a typo; if not, please consult our document."""
+            )
+        module, dict_arg, options = _WORD_ENGINES[engine]
+        segment = import_module(module, __package__).segment
+        if options:
+            segment = partial(segment, **options)
+        entry = _ENGINES[engine] = (segment, dict_arg)
+
+    return entry
+
+
+def _segment(
+    segmenter: Tuple[Callable[..., List[str]], Optional[str]],
+    text: str,
+    custom_dict: Trie = None,
+    keep_whitespace: bool = True,
+) -> List[str]:
+    """
+    Call a word tokenizer engine's segment function, from
+    :func:`_get_engine`, with the arguments the engine accepts.
+
+    Engines taking keep_whitespace drop whitespaces themselves,
+    for other engines whitespaces are dropped afterwards.
+    """
+    segment, dict_arg = segmenter
+
+    if dict_arg == _DICT_TRIE_WHITESPACE:
+        segments = segment(text, custom_dict, keep_whitespace=keep_whitespace)
+    else:
+        if dict_arg == _DICT_TRIE:
+            segments = segment(text, custom_dict)
+        elif dict_arg == _DICT_LIST and custom_dict:
+            segments = segment(text, list(custom_dict))
+        else:
+            segments = segment(text)
+
+        segments = to_token_list(segments, keep_whitespace)
+
+    return segments
+
+
+def _intern_tokens(segments: List[str]) -> Tuple[str, ...]:
+    """
+    Intern short tokens, so repeated words share one string object.
+
+    Tokens of str subclasses, like multi_cut.LatticeString,
+    cannot be interned and are kept as is.
+    """
+    intern = sys.intern
+    return tuple(
+        intern(token)
+        if len(token) < _INTERN_MAX_TOKEN_LEN and type(token) is str
+        else token
+        for token in segments
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _word_tokenize_cached(
+    text: str, engine: str, keep_whitespace: bool, dict_version: int
+) -> Tuple[str, ...]:
+    """
+    Tokenize text with the engine's default dictionary, results are cached.
+
+    dict_version is the version of the default dictionary trie, so
+    results from before a change to the dictionary are not reused.
+    A tuple is returned so callers cannot change the cached result,
+    and its short tokens are interned as it may be kept for long.
+    """
+    segments = _segment(
+        _get_engine(engine), text, keep_whitespace=keep_whitespace
+    )
+
+    return _intern_tokens(segments)
+
+
+def _word_tokenize(
+    text: str,
+    custom_dict: Trie,
+    engine: str,
+    keep_whitespace: bool,
+    segmenter: Tuple[Callable[..., List[str]], Optional[str]] = None,
+) -> List[str]:
+    """
+    Tokenize a non-empty text, from cache when custom_dict is not given
+    and the text is short.
+
+    segmenter is the engine from :func:`_get_engine`,
+    it is looked up only when needed if not given.
+    """
+    if custom_dict is None and len(text) <= _CACHE_MAX_TEXT_LEN:
+        return list(
+            _word_tokenize_cached(
+                text, engine, keep_whitespace, DEFAULT_WORD_DICT_TRIE.version
+            )
+        )
+
+    if segmenter is None:
+        segmenter = _get_engine(engine)
+
+    return _segment(segmenter, text, custom_dict, keep_whitespace)
+
 
 def clause_tokenize(doc: List[str]) -> List[List[str]]:
     """
@@ -78,6 +243,8 @@ def word_tokenize(
     :Note:
         - The parameter **custom_dict** can be provided as an argument \
           only for *newmm*, *longest*, and *attacut* engine.
+        - When **custom_dict** is not given, results for short texts \
+          are cached until the default dictionary is modified.
     :Example:
 
     Tokenize text with different tokenizer::
@@ -126,57 +293,62 @@ def word_tokenize(
         # ['ชินโซ', ' ', 'อาเบะ',
         #   ' ', 'เกิด', ' ', '21', ' ', 'กันยายน']
     """
-    if not text or not isinstance(text, str):
+    if not isinstance(text, str) or not text:
         return []
 
-    segments = []
+    return _word_tokenize(text, custom_dict, engine, keep_whitespace)
 
-    if engine == "newmm" or engine == "onecut":
-        from .newmm import segment
 
-        segments = segment(text, custom_dict)
-    elif engine == "newmm-safe":
-        from .newmm import segment
+def word_tokenize_batch(
+    texts: Iterable[str],
+    custom_dict: Trie = None,
+    engine: str = DEFAULT_WORD_TOKENIZE_ENGINE,
+    keep_whitespace: bool = True,
+) -> List[List[str]]:
+    """
+    Word tokenizer for many texts.
 
-        segments = segment(text, custom_dict, safe_mode=True)
-    elif engine == "attacut":
-        from .attacut import segment
+    Tokenizes each text in texts the same way as
+    :func:`pythainlp.tokenize.word_tokenize`, sharing its cache of
+    short texts, but looks up the engine only once for the whole batch.
 
-        segments = segment(text)
-    elif engine == "longest":
-        from .longest import segment
+    :param Iterable[str] texts: texts to be tokenized
+    :param pythainlp.util.Trie custom_dict: dictionary trie
+    :param str engine: name of the tokenizer to be used
+    :param bool keep_whitespace: True to keep whitespaces, a common mark
+                                 for end of phrase in Thai.
+                                 Otherwise, whitespaces are omitted.
+    :return: list of lists of words, one list for each text
+    :rtype: list[list[str]]
 
-        segments = segment(text, custom_dict)
-    elif engine == "mm" or engine == "multi_cut":
-        from .multi_cut import segment
+    :Example:
+    ::
 
-        segments = segment(text, custom_dict)
-    elif engine == "deepcut":  # deepcut can optionally use dictionary
-        from .deepcut import segment
+        from pythainlp.tokenize import word_tokenize_batch
 
-        if custom_dict:
-            custom_dict = list(custom_dict)
-            segments = segment(text, custom_dict)
-        else:
-            segments = segment(text)
-    elif engine == "icu":
-        from .pyicu import segment
+        word_tokenize_batch(["ฉันรักภาษาไทย", "เพราะฉันเป็นคนไทย"])
+        # output:
+        # [['ฉัน', 'รัก', 'ภาษาไทย'], ['เพราะ', 'ฉัน', 'เป็น', 'คนไทย']]
+    """
+    segmenter = _get_engine(engine)
 
-        segments = segment(text)
-    else:
-        raise ValueError(
-            f"""Tokenizer \"{engine}\" not found.
-            It might be a typo; if not, please consult our document."""
-        )
+    tokenized = []
+    for text in texts:
+        if not isinstance(text, str) or not text:
+            tokenized.append([])
+            continue
 
-    if not keep_whitespace:
-        segments = [token.strip(" ") for token in segments if token.strip(" ")]
+        tokenized.append(
+            _word_tokenize(
+                text, custom_dict, engine, keep_whitespace, segmenter
+            )
+        )
 
-    return segments
+    return tokenized
 
 
 def sent_tokenize(
-    text: str,
+    text: Union[str, List[str]],
     engine: str = DEFAULT_SENT_TOKENIZE_ENGINE,
     keep_whitespace: bool = True,
 ) -> List[str]:
@@ -185,7 +357,10 @@ def sent_tokenize(
 
     Tokenizes running text into "sentences"
 
-    :param str text: the text to be tokenized
+    :param str|List[str] text: the text to be tokenized, or a list (or tuple)
+                     of sentences already split, which is returned as a new
+                     list (with whitespaces omitted if keep_whitespace is
+                     False)
     :param str engine: choose among *'crfcut'*, *'whitespace'*, \
     *'whitespace+newline'*
     :return: list of splited sentences
@@ -238,17 +413,22 @@ def sent_tokenize(
         'และเขาได้รับมอบหมายให้ประจำในระดับภูมิภาค']
     """
 
-    if not text or not isinstance(text, str):
+    if isinstance(text, (list, tuple)):
+        # already split into sentences, only the engine name is checked
+        if engine not in _SENT_ENGINES:
+            raise ValueError(
+                f"""Tokenizer \"{engine}\" not found.
+            It might be a typo; if not, please consult our document."""
+            )
+        segments = list(text)
+    elif not isinstance(text, str) or not text:
         return []
-
-    segments = []
-
-    if engine == "crfcut":
+    elif engine == "crfcut":
         from .crfcut import segment
 
         segments = segment(text)
     elif engine == "whitespace":
-        segments = re.split(r" +", text, re.U)
+        segments = _PAT_SPACES.split(text)
     elif engine == "whitespace+newline":
         segments = text.split()
     else:
@@ -257,8 +437,7 @@ def sent_tokenize(
             It might be a typo; if not, please consult our document."""
         )
 
-    if not keep_whitespace:
-        segments = [token.strip(" ") for token in segments if token.strip(" ")]
+    segments = to_token_list(segments, keep_whitespace)
 
     return segments
 
@@ -321,7 +500,7 @@ def subword_tokenize(
         subword_tokenize(text_2, engine='etcc')
         # output: ['ความแปลกแยกและ', 'พัฒ', 'นาการ']
     """
-    if not text or not isinstance(text, str):
+    if not isinstance(text, str) or not text:
         return []
 
     if engine == "tcc":
@@ -336,8 +515,7 @@ def subword_tokenize(
 
     segments = segment(text)
 
-    if not keep_whitespace:
-        segments = [token.strip(" ") for token in segments if token.strip(" ")]
+    segments = to_token_list(segments, keep_whitespace)
 
     return segments
 
@@ -380,19 +558,16 @@ def syllable_tokenize(
         'รถ', 'จักร', 'ดี', 'เซล', ' ', 'หรือ', 'จาก', 'ไฟ', 'ฟ้า']
     """
 
-    if not text or not isinstance(text, str):
+    if not isinstance(text, str) or not text:
         return []
 
     segments = []
 
     if engine == "dict" or engine == "default":  # use syllable dictionary
+        segment, _ = _get_engine("newmm")
         words = word_tokenize(text)
         for word in words:
-            segments.extend(
-                word_tokenize(
-                    text=word, custom_dict=DEFAULT_SYLLABLE_DICT_TRIE
-                )
-            )
+            segments.extend(segment(word, DEFAULT_SYLLABLE_DICT_TRIE))
     elif engine == "ssg":
         from .ssg import segment
 
@@ -403,8 +578,7 @@ def syllable_tokenize(
             It might be a typo; if not, please consult our document."""
         )
 
-    if not keep_whitespace:
-        segments = [token.strip(" ") for token in segments if token.strip(" ")]
+    segments = to_token_list(segments, keep_whitespace)
 
     return segments
 
@@ -491,13 +665,20 @@ class Tokenizer:
                            (i.e.  *newmm*, *longest*, *attacut*)
         :param bool keep_whitespace: True to keep whitespaces, a common mark
                                     for end of phrase in Thai
+
+        :Note:
+            - The engine is loaded on the first call to
+              :meth:`word_tokenize`, not at initialization.
         """
+        # trie nodes are only built on first lookup,
+        # so creating the trie here is cheap
         self.__trie_dict = None
         if custom_dict:
             self.__trie_dict = dict_trie(custom_dict)
         else:
             self.__trie_dict = DEFAULT_WORD_DICT_TRIE
         self.__engine = engine
+        self.__segmenter = None
         self.__keep_whitespace = keep_whitespace
 
     def word_tokenize(self, text: str) -> List[str]:
@@ -508,11 +689,17 @@ class Tokenizer:
         :return: list of words, tokenized from the text
         :rtype: list[str]
         """
-        return word_tokenize(
+        if not isinstance(text, str) or not text:
+            return []
+
+        if self.__segmenter is None:
+            self.__segmenter = _get_engine(self.__engine)
+
+        return _segment(
+            self.__segmenter,
             text,
-            custom_dict=self.__trie_dict,
-            engine=self.__engine,
-            keep_whitespace=self.__keep_whitespace,
+            self.__trie_dict,
+            self.__keep_whitespace,
         )
 
     def set_tokenize_engine(self, engine: str) -> None:
@@ -522,4 +709,5 @@ class Tokenizer:
         :param str engine: choose between different options of engine to token
                            (i.e. *newmm*, *longest*, *attacut*)
         """
+        self.__segmenter = None
         self.__engine = engine
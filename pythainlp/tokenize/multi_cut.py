@@ -15,6 +15,7 @@ from collections import defaultdict
 from typing import List
 
 from pythainlp.tokenize import DEFAULT_WORD_DICT_TRIE
+from pythainlp.tokenize._utils import to_token_list
 from pythainlp.util import Trie
 
 
@@ -122,19 +123,25 @@ def _combine(ww: str):
 
 
 def segment(
-    text: str, custom_dict: Trie = DEFAULT_WORD_DICT_TRIE
+    text: str,
+    custom_dict: Trie = DEFAULT_WORD_DICT_TRIE,
+    keep_whitespace: bool = True,
 ) -> List[str]:
     """
     Dictionary-based maximum matching word segmentation.
 
     :param str text: text to be tokenized to words
     :param pythainlp.util.Trie custom_dict: dictionary for tokenization
+    :param bool keep_whitespace: True to keep whitespaces, a common mark\
+        for end of phrase in Thai. Otherwise, whitespaces are omitted.
     :return: list of words, tokenized from the text
     """
     if not text or not isinstance(text, str):
         return []
 
-    return list(_multicut(text, custom_dict=custom_dict))
+    tokens = _multicut(text, custom_dict=custom_dict)
+
+    return to_token_list(tokens, keep_whitespace)
 
 
 def find_all_segment(
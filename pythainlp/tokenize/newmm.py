@@ -15,9 +15,11 @@ with heuristic graph size limit added to avoid exponential wait time.
 import re
 from collections import defaultdict
 from heapq import heappop, heappush
+from itertools import chain
 from typing import Generator, List
 
 from pythainlp.tokenize import DEFAULT_WORD_DICT_TRIE
+from pythainlp.tokenize._utils import to_token_list
 from pythainlp.util import Trie
 
 from .tcc import tcc_pos
@@ -137,6 +139,7 @@ def segment(
     text: str,
     custom_dict: Trie = DEFAULT_WORD_DICT_TRIE,
     safe_mode: bool = False,
+    keep_whitespace: bool = True,
 ) -> List[str]:
     """
     Dictionary-based maximal matching word segmentation, constrained with
@@ -147,6 +150,8 @@ def segment(
     :param bool safe_mode: True to help avoid long wait for text with long\
         and continuous ambiguous breaking points. Long wait may still able\
         to occur. Default is False.
+    :param bool keep_whitespace: True to keep whitespaces, a common mark\
+        for end of phrase in Thai. Otherwise, whitespaces are omitted.
     :return: list of words, tokenized from the text
     """
     if not text or not isinstance(text, str):
@@ -156,7 +161,7 @@ def segment(
         custom_dict = DEFAULT_WORD_DICT_TRIE
 
     if not safe_mode or len(text) < _TEXT_SCAN_END:
-        return list(_onecut(text, custom_dict))
+        return to_token_list(_onecut(text, custom_dict), keep_whitespace)
 
     # if the text is longer than the limit,
     # breaks them into smaller chunks then tokenizes each chunk
@@ -193,8 +198,8 @@ def segment(
         text_parts.append(text)
 
     # tokenizes each text parts
-    tokens = []
-    for text_part in text_parts:
-        tokens.extend(list(_onecut(text_part, custom_dict)))
+    tokens = chain.from_iterable(
+        _onecut(text_part, custom_dict) for text_part in text_parts
+    )
 
-    return tokens
+    return to_token_list(tokens, keep_whitespace)
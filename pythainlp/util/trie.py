@@ -4,8 +4,12 @@ Trie data structure.
 
 Designed to use for tokenizer's dictionary, but can be for other purposes.
 """
+from threading import Lock
 from typing import Iterable, List, Union
 
+# guards the lazy building of Trie nodes
+_BUILD_LOCK = Lock()
+
 
 class Trie:
     class Node(object):
@@ -17,10 +21,36 @@ class Trie:
 
     def __init__(self, words: Iterable[str]):
         self.words = set(words)
-        self.root = Trie.Node()
+        self.words.update([word.strip() for word in self.words])
+        self.__root = None  # nodes are built on first use, see root
+        self.version = 0  # incremented on every add() and remove()
+
+    @property
+    def root(self) -> "Trie.Node":
+        """
+        Root node of the trie.
 
-        for word in words:
-            self.add(word)
+        Nodes are built from the words on first access, so creating
+        a large trie that is never used for lookup costs little.
+        """
+        if self.__root is None:
+            with _BUILD_LOCK:
+                if self.__root is None:
+                    # build fully before publishing, so other threads
+                    # never see a partially built trie
+                    root = Trie.Node()
+                    for word in list(self.words):
+                        cur = root
+                        for ch in word.strip():
+                            child = cur.children.get(ch)
+                            if not child:
+                                child = Trie.Node()
+                                cur.children[ch] = child
+                            cur = child
+                        cur.end = True
+                    self.__root = root
+
+        return self.__root
 
     def add(self, word: str) -> None:
         """
@@ -31,7 +61,9 @@ class Trie:
         """
         word = word.strip()
         self.words.add(word)
-        cur = self.root
+        cur = self.__root
+        if cur is None:
+            cur = self.root
         for ch in word:
             child = cur.children.get(ch)
             if not child:
@@ -39,6 +71,7 @@ class Trie:
                 cur.children[ch] = child
             cur = child
         cur.end = True
+        self.version += 1
 
     def remove(self, word: str) -> None:
         """
@@ -50,9 +83,9 @@ class Trie:
         # remove from set first
         if word not in self.words:
             return
+        parent = self.root  # build nodes before the word leaves the set
         self.words.remove(word)
         # then remove from nodes
-        parent = self.root
         data = []  # track path to leaf
         for ch in word:
             child = parent.children[ch]
@@ -65,6 +98,7 @@ class Trie:
             if child.end or child.children:
                 break
             del parent.children[ch]   # remove from parent dict
+        self.version += 1
 
     def prefixes(self, text: str) -> List[str]:
         """
@@ -75,7 +109,11 @@ class Trie:
         :rtype: List[str]
         """
         res = []
-        cur = self.root
+        # read the built root directly, this is the innermost lookup
+        # of dictionary-based tokenizers
+        cur = self.__root
+        if cur is None:
+            cur = self.root
         for i, ch in enumerate(text):
             node = cur.children.get(ch)
             if not node:
@@ -101,22 +139,26 @@ def dict_trie(dict_source: Union[str, Iterable[str], Trie]) -> Trie:
 
     :param str|Iterable[str]|pythainlp.util.Trie dict_source: a path to
         dictionary file or a list of words or a pythainlp.util.Trie object
-    :return: a trie object
+    :return: a trie object, or dict_source itself if it is already
+        a pythainlp.util.Trie object
     :rtype: pythainlp.util.Trie
     """
     trie = None
 
-    if isinstance(dict_source, str) and len(dict_source) > 0:
+    if isinstance(dict_source, Trie):
+        # already a trie, use it as is
+        trie = dict_source
+    elif isinstance(dict_source, str) and len(dict_source) > 0:
         # dict_source is a path to dictionary text file
         with open(dict_source, "r", encoding="utf8") as f:
-            _vocabs = f.read().splitlines()
-            trie = Trie(_vocabs)
+            trie = Trie(line.rstrip("\n") for line in f)
     elif isinstance(dict_source, Iterable) and not isinstance(
         dict_source, str
     ):
         # Note: Since Trie and str are both Iterable,
         # so the Iterable check should be here, at the very end,
-        # because it has less specificality
+        # because it has less specificality.
+        # It is also the slowest check, as Iterable is an abstract class
         trie = Trie(dict_source)
     else:
         raise TypeError(
@@ -17,7 +17,9 @@ from pythainlp.tokenize import (
     syllable_tokenize,
     tcc,
     word_tokenize,
+    word_tokenize_batch,
 )
+from pythainlp.tokenize.core import _word_tokenize_cached
 from pythainlp.tokenize.ssg import segment as ssg_segment
 from pythainlp.util import dict_trie
 
@@ -202,6 +204,21 @@ class TestTokenizePackage(unittest.TestCase):
         t_test = Tokenizer()
         self.assertEqual(t_test.word_tokenize("ก"), ["ก"])
 
+        words = ["ทด", "สอบ"]
+        t_test = Tokenizer(words)
+        words.append("ทดสอบ")  # must not change the tokenizer's dictionary
+        self.assertEqual(t_test.word_tokenize("ทดสอบ"), ["ทด", "สอบ"])
+        with self.assertRaises(FileNotFoundError):
+            Tokenizer("/path/to/missing/custom_dict.txt")
+
+        t_test = Tokenizer(["ทด", "สอบ"], keep_whitespace=False)
+        self.assertEqual(t_test.word_tokenize("ทด  สอบ"), ["ทด", "สอบ"])
+        t_test.set_tokenize_engine("longest")
+        self.assertEqual(t_test.word_tokenize("ทด  สอบ"), ["ทด", "สอบ"])
+        t_test.set_tokenize_engine("XX")
+        with self.assertRaises(ValueError):
+            t_test.word_tokenize("ทดสอบ")  # engine does not exist
+
     def test_etcc(self):
         self.assertEqual(etcc.segment(None), [])
         self.assertEqual(etcc.segment(""), [])
@@ -237,6 +254,50 @@ class TestTokenizePackage(unittest.TestCase):
             "ไฟ" in word_tokenize("รถไฟฟ้า", custom_dict=dict_trie(["ไฟ"]))
         )
 
+    def test_word_tokenize_batch(self):
+        self.assertEqual(word_tokenize_batch([]), [])
+        self.assertEqual(
+            word_tokenize_batch(["ฉันรักภาษาไทย", "", None, "จุ๋ม   ง่วง"]),
+            [
+                ["ฉัน", "รัก", "ภาษาไทย"],
+                [],
+                [],
+                ["จุ๋ม", "   ", "ง่วง"],
+            ],
+        )
+        self.assertEqual(
+            word_tokenize_batch(
+                ["จุ๋ม   ง่วง"], engine="longest", keep_whitespace=False
+            ),
+            [["จุ๋ม", "ง่วง"]],
+        )
+        with self.assertRaises(ValueError):
+            word_tokenize_batch(["หมอนทอง"], engine="XX")
+
+        # short texts share word_tokenize cache, which follows
+        # changes to the default dictionary
+        self.assertEqual(
+            word_tokenize_batch(["ภาษาไทยกขค"]),
+            [["ภาษา", "ไท", "ยก", "ขค"]],
+        )
+        hits = _word_tokenize_cached.cache_info().hits
+        self.assertEqual(
+            word_tokenize_batch(["ภาษาไทยกขค"]),
+            [word_tokenize("ภาษาไทยกขค")],
+        )
+        self.assertEqual(_word_tokenize_cached.cache_info().hits, hits + 2)
+        DEFAULT_WORD_DICT_TRIE.add("กขค")
+        try:
+            self.assertEqual(
+                word_tokenize_batch(["ภาษาไทยกขค"]), [["ภาษาไทย", "กขค"]]
+            )
+        finally:
+            DEFAULT_WORD_DICT_TRIE.remove("กขค")
+        self.assertEqual(
+            word_tokenize_batch(["ภาษาไทยกขค"]),
+            [["ภาษา", "ไท", "ยก", "ขค"]],
+        )
+
     def test_word_tokenize_deepcut(self):
         self.assertEqual(tokenize_deepcut.segment(None), [])
         self.assertEqual(tokenize_deepcut.segment(""), [])
@@ -262,6 +323,12 @@ class TestTokenizePackage(unittest.TestCase):
     def test_word_tokenize_longest(self):
         self.assertEqual(longest.segment(None), [])
         self.assertEqual(longest.segment(""), [])
+        self.assertEqual(
+            word_tokenize(
+                "จุ๋ม   ง่วง", engine="longest", keep_whitespace=False
+            ),
+            ["จุ๋ม", "ง่วง"],
+        )
         self.assertIsInstance(
             longest.segment("กรุงเทพฯมากๆเพราโพาง BKKฯ"), list
         )
@@ -281,6 +348,10 @@ class TestTokenizePackage(unittest.TestCase):
     def test_word_tokenize_mm(self):
         self.assertEqual(multi_cut.segment(None), [])
         self.assertEqual(multi_cut.segment(""), [])
+        self.assertEqual(
+            multi_cut.segment("ฉันรัก  ภาษาไทย", keep_whitespace=False),
+            ["ฉัน", "รัก", "ภาษาไทย"],
+        )
         self.assertIsNotNone(multi_cut.segment("ตัด", dict_trie([""])))
 
         self.assertEqual(word_tokenize("", engine="mm"), [])
@@ -299,6 +370,32 @@ class TestTokenizePackage(unittest.TestCase):
     def test_word_tokenize_newmm(self):
         self.assertEqual(newmm.segment(None), [])
         self.assertEqual(newmm.segment(""), [])
+        self.assertEqual(
+            newmm.segment("จุ๋ม   ง่วง", keep_whitespace=False),
+            ["จุ๋ม", "ง่วง"],
+        )
+        tokens = word_tokenize("ฉันรักภาษาไทย", engine="newmm")
+        tokens.append("ไหม")  # must not change the cached result
+        self.assertEqual(
+            word_tokenize("ฉันรักภาษาไทย", engine="newmm"),
+            ["ฉัน", "รัก", "ภาษาไทย"],
+        )
+        self.assertIs(
+            word_tokenize("ฉันรัก")[0], word_tokenize("รักฉัน")[1]
+        )  # short tokens in cached results are interned
+
+        # cached results must follow changes to the default dictionary
+        self.assertEqual(
+            word_tokenize("ภาษาไทยกขค"), ["ภาษา", "ไท", "ยก", "ขค"]
+        )
+        DEFAULT_WORD_DICT_TRIE.add("กขค")
+        try:
+            self.assertEqual(word_tokenize("ภาษาไทยกขค"), ["ภาษาไทย", "กขค"])
+        finally:
+            DEFAULT_WORD_DICT_TRIE.remove("กขค")
+        self.assertEqual(
+            word_tokenize("ภาษาไทยกขค"), ["ภาษา", "ไท", "ยก", "ขค"]
+        )
         self.assertEqual(
             word_tokenize("ฉันรักภาษาไทยเพราะฉันเป็นคนไทย", engine="newmm"),
             ["ฉัน", "รัก", "ภาษาไทย", "เพราะ", "ฉัน", "เป็น", "คนไทย"],
@@ -324,6 +421,10 @@ class TestTokenizePackage(unittest.TestCase):
             ),
             ["จุ๋ม", "ง่วง"],
         )
+        self.assertEqual(
+            word_tokenize("จุ๋มง่วง", engine="newmm", keep_whitespace=False),
+            ["จุ๋ม", "ง่วง"],
+        )
         self.assertFalse(
             " " in word_tokenize("จุ๋มง่วง", keep_whitespace=False,)
         )
@@ -367,10 +468,28 @@ class TestTokenizePackage(unittest.TestCase):
     def test_sent_tokenize(self):
         self.assertEqual(sent_tokenize(None), [])
         self.assertEqual(sent_tokenize(""), [])
+        self.assertEqual(sent_tokenize([]), [])
+        self.assertEqual(
+            sent_tokenize(["รักน้ำ", "รักปลา"]), ["รักน้ำ", "รักปลา"]
+        )
+        self.assertEqual(
+            sent_tokenize(["รักน้ำ ", " "], keep_whitespace=False), ["รักน้ำ"]
+        )
+        self.assertEqual(
+            sent_tokenize(("รักน้ำ", "รักปลา")), ["รักน้ำ", "รักปลา"]
+        )
+        sents = ["รักน้ำ", "รักปลา"]
+        self.assertIsNot(sent_tokenize(sents), sents)
+        with self.assertRaises(ValueError):
+            sent_tokenize(sents, engine="XX")
         self.assertEqual(
             sent_tokenize("รักน้ำ  รักปลา  ", engine="whitespace"),
             ["รักน้ำ", "รักปลา", ""],
         )
+        self.assertEqual(
+            len(sent_tokenize(" ".join(["ปลา"] * 40), engine="whitespace")),
+            40,
+        )
         self.assertEqual(
             sent_tokenize("รักน้ำ  รักปลา  ", engine="whitespace+newline"),
             ["รักน้ำ", "รักปลา"],
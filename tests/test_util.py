@@ -3,6 +3,8 @@
 Unit tests for pythainlp.util module.
 """
 import os
+import tempfile
+import threading
 import unittest
 from collections import Counter
 from datetime import datetime, time, timedelta, timezone
@@ -381,6 +383,9 @@ class TestUtilPackage(unittest.TestCase):
         self.assertIsNotNone(Trie({"ทอด", "ทอง", "ทาง"}))
         self.assertIsNotNone(Trie(("ทอด", "ทอง", "ทาง")))
         self.assertIsNotNone(Trie(Trie(["ทดสอบ", "ทดลอง"])))
+        self.assertEqual(
+            len(Trie(w for w in ["ทด", "ทดสอบ"]).prefixes("ทดสอบ")), 2
+        )
 
         trie = Trie(["ทด", "ทดสอบ", "ทดลอง"])
         self.assertIn("ทด", trie)
@@ -392,12 +397,38 @@ class TestUtilPackage(unittest.TestCase):
         trie.remove("ทด")
         self.assertEqual(len(trie), 2)
 
+        trie = Trie(["ทด", "ทดสอบ"])
+        trie.remove("ทดสอบ")  # before any lookup
+        self.assertEqual(trie.prefixes("ทดสอบ"), ["ทด"])
+
+        # nodes are built on first lookup, concurrent first lookups
+        # must all see the complete trie
+        text = "ภาษาไทย"
+        expected = Trie(thai_words()).prefixes(text)
+        for _ in range(3):
+            trie = Trie(thai_words())
+            barrier = threading.Barrier(4)
+            results = []
+
+            def lookup():
+                barrier.wait()
+                results.append(trie.prefixes(text))
+
+            threads = [threading.Thread(target=lookup) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(results, [expected] * 4)
+
         trie = Trie([])
         self.assertEqual(len(trie), 0)
         trie.remove("หมด")
         self.assertEqual(len(trie), 0)
 
         self.assertIsNotNone(dict_trie(Trie(["ลอง", "ลาก"])))
+        trie = Trie(["ลอง", "ลาก"])
+        self.assertIs(dict_trie(trie), trie)
         self.assertIsNotNone(dict_trie(("ลอง", "สร้าง", "Trie", "ลน")))
         self.assertIsNotNone(dict_trie(["ลอง", "สร้าง", "Trie", "ลน"]))
         self.assertIsNotNone(dict_trie({"ลอง", "สร้าง", "Trie", "ลน"}))
@@ -405,6 +436,14 @@ class TestUtilPackage(unittest.TestCase):
         self.assertIsNotNone(
             dict_trie(os.path.join(_CORPUS_PATH, _THAI_WORDS_FILENAME))
         )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dict_path = os.path.join(tmp_dir, "words.txt")
+            with open(dict_path, "w", encoding="utf8") as f:
+                f.write("ลอง\nลองดู\nลาก")  # no newline at end
+            trie = dict_trie(dict_path)
+            self.assertEqual(trie.words, {"ลอง", "ลองดู", "ลาก"})
+            self.assertEqual(trie.prefixes("ลองดูนะ"), ["ลอง", "ลองดู"])
+            self.assertEqual(trie.prefixes("ลาก"), ["ลาก"])
         with self.assertRaises(TypeError):
             dict_trie("")
         with self.assertRaises(TypeError):